@@ -8,6 +8,8 @@ import re
 class SignalForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop('user', None)
+        # Optional rows already loaded by the view (dicts with at least 'id' and 'name', in id order)
+        signal_types_data = kwargs.pop('signal_types', None)
         super().__init__(*args, **kwargs)
         # Set default signal_type (prefer "Common Trade Alert" if it exists)
         if 'signal_type' in self.fields:
@@ -21,10 +23,19 @@ class SignalForm(forms.ModelForm):
             # Filter queryset to only show available signal types
             self.fields['signal_type'].queryset = signal_types
 
-            preferred = signal_types.filter(name__iexact='Common Trade Alert').first()
-            first_signal_type = preferred or signal_types.first()
-            if first_signal_type:
-                self.fields['signal_type'].initial = first_signal_type.id
+            if signal_types_data is not None:
+                # Reuse the view's rows for the default and the <select> options instead of
+                # querying again; the queryset above is still what validates the submission.
+                preferred = next((st for st in signal_types_data if st['name'].lower() == 'common trade alert'), None)
+                first_signal_type = preferred or (signal_types_data[0] if signal_types_data else None)
+                if first_signal_type:
+                    self.fields['signal_type'].initial = first_signal_type['id']
+                self.fields['signal_type'].choices = [(st['id'], st['name']) for st in signal_types_data]
+            else:
+                preferred = signal_types.filter(name__iexact='Common Trade Alert').first()
+                first_signal_type = preferred or signal_types.first()
+                if first_signal_type:
+                    self.fields['signal_type'].initial = first_signal_type.id
             # Remove the empty label (--------)
             self.fields['signal_type'].empty_label = None
     
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('signals', '0020_position_highest_price'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='position',
+            index=models.Index(condition=models.Q(('entry_price__isnull', False), ('exit_price__isnull', False)), fields=['status', 'closed_at'], name='pos_status_closed_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('signals', '0021_position_status_closed_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='signal',
+            index=models.Index(fields=['user', '-created_at'], name='signal_user_created_idx'),
+        ),
+    ]
@@ -55,6 +55,10 @@ class Signal(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Signal history lists one user's signals newest first.
+            models.Index(fields=['user', '-created_at'], name='signal_user_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.data.get('ticker', 'Unknown')} - {self.signal_type.name}"
@@ -245,6 +249,14 @@ class Position(models.Model):
 
     class Meta:
         ordering = ["-opened_at", "-created_at"]
+        indexes = [
+            # Leaderboard scans closed positions with prices in a closed_at window.
+            models.Index(
+                fields=["status", "closed_at"],
+                name="pos_status_closed_idx",
+                condition=models.Q(entry_price__isnull=False) & models.Q(exit_price__isnull=False),
+            ),
+        ]
 
     def __str__(self):
         base = self.symbol or "Unknown"
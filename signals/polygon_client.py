@@ -4,6 +4,12 @@ import time
 from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
 
 # In-memory TTL cache for quotes to reduce Polygon API call count (rate limits).
 _quote_cache: Dict[str, tuple] = {}
@@ -65,7 +71,20 @@ class PolygonClient:
             handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
-        self.last_error: Optional[Dict[str, Any]] = None
+        # One pooled session per client so keep-alive connections are reused across calls.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        # Clients are shared across request threads (see views._get_polygon_client), so the
+        # last error is tracked per thread.
+        self._local = threading.local()
+
+    @property
+    def last_error(self) -> Optional[Dict[str, Any]]:
+        return getattr(self._local, "last_error", None)
+
+    @last_error.setter
+    def last_error(self, value: Optional[Dict[str, Any]]) -> None:
+        self._local.last_error = value
 
     def _get(self, path: str, *, params: Optional[Dict[str, Any]] = None, timeout: int = 6) -> Optional[Dict[str, Any]]:
         if not self.api_key:
@@ -75,7 +94,7 @@ class PolygonClient:
         p = dict(params or {})
         p["apiKey"] = self.api_key
         try:
-            resp = requests.get(url, params=p, timeout=timeout)
+            resp = self.session.get(url, params=p, timeout=timeout)
             if resp.status_code != 200:
                 # Keep a small snippet for debugging (avoid huge payloads).
                 body = ""
@@ -85,11 +104,18 @@ class PolygonClient:
                     body = ""
                 self.last_error = {"kind": "http_error", "status": resp.status_code, "url": url, "body": body}
                 return None
+            if not resp.content:
+                self.last_error = None
+                return None
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
             self.last_error = None
-            return resp.json() if resp.content else None
+            return data
         except requests.RequestException:
             self.last_error = {"kind": "network_error", "url": url}
             return None
+        except ValueError:
+            self.last_error = {"kind": "invalid_json", "url": url}
+            return None
 
     def get_ticker_details(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Get ticker details (company name, etc.)."""
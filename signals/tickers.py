@@ -1,9 +1,15 @@
 import json
 import os
+import threading
 from functools import lru_cache
 
 from django.conf import settings
 
+try:
+    import numpy as np
+except ImportError:  # Optional: search falls back to a pure-Python scan.
+    np = None
+
 
 # Cached data lives in signals/data/us_tickers.json (generated by management command).
 TICKERS_DATA_PATH = os.path.join(settings.BASE_DIR, "signals", "data", "us_tickers.json")
@@ -55,3 +61,56 @@ def get_us_tickers():
     """
     return _load_tickers_file()
 
+
+# Search index over get_us_tickers(), rebuilt only when the tickers file changes on disk.
+_TICKERS_CACHE = {"mtime": 0, "data": None, "arrays": None}
+_TICKERS_CACHE_LOCK = threading.Lock()
+
+
+def _tickers_file_mtime() -> float:
+    try:
+        return os.path.getmtime(TICKERS_DATA_PATH)
+    except OSError:
+        return 0
+
+
+def _get_ticker_index():
+    mtime = _tickers_file_mtime()
+    with _TICKERS_CACHE_LOCK:
+        if _TICKERS_CACHE["data"] is not None and _TICKERS_CACHE["mtime"] == mtime:
+            return _TICKERS_CACHE["data"], _TICKERS_CACHE["arrays"]
+        if _TICKERS_CACHE["data"] is not None:
+            get_us_tickers.cache_clear()
+        ts = tuple(t for t in (get_us_tickers() or []) if isinstance(t, dict) and str(t.get("symbol") or "").strip())
+        upper_syms = tuple(str(t["symbol"]).strip().upper() for t in ts)
+        lower_names = tuple(str(t.get("name") or "").strip().lower() for t in ts)
+        data = (ts, upper_syms, lower_names, frozenset(upper_syms))
+        # Fixed-width unicode arrays let np.char.find run the substring scan in C.
+        arrays = (np.array(upper_syms, dtype=str), np.array(lower_names, dtype=str)) if np is not None and ts else None
+        _TICKERS_CACHE["mtime"] = mtime
+        _TICKERS_CACHE["data"] = data
+        _TICKERS_CACHE["arrays"] = arrays
+        return data, arrays
+
+
+def get_indexed_us_tickers():
+    """
+    Returns (tickers, upper_symbols, lower_names, symbol_set) for fast substring search.
+
+    The three tuples are parallel (same index = same ticker). The index is built once and
+    reused until the tickers file mtime changes, at which point get_us_tickers() is reloaded.
+    """
+    return _get_ticker_index()[0]
+
+
+def search_us_tickers(q_upper: str, q_lower: str) -> list:
+    """
+    Return cached tickers whose symbol contains q_upper or whose name contains q_lower.
+    Uses NumPy vectorized string search when available.
+    """
+    (ts, upper_syms, lower_names, _), arrays = _get_ticker_index()
+    if arrays is not None:
+        upper_arr, lower_arr = arrays
+        mask = (np.char.find(upper_arr, q_upper) >= 0) | (np.char.find(lower_arr, q_lower) >= 0)
+        return [ts[i] for i in np.flatnonzero(mask).tolist()]
+    return [ts[i] for i, (sym_up, name_lo) in enumerate(zip(upper_syms, lower_names)) if q_upper in sym_up or q_lower in name_lo]
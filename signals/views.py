@@ -6,30 +6,156 @@ from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import PasswordChangeForm
 from django.conf import settings
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_GET
 from django.views.decorators.http import require_http_methods
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, FloatField, OuterRef, Prefetch, Q, Value
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.fields.json import KeyTextTransform
+from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.functional import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from bisect import bisect_left
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+from urllib3.util.retry import Retry
 import re
 import json
+import hashlib
 import html
+import threading
+import time
 from .forms import SignalForm, SignalTypeForm
 from .models import Signal, SignalType, UserProfile, DiscordChannel, UserTradePlan, UserTradePlanPreset, Agreement, AgreementAcceptance, Position
-from .tickers import get_us_tickers
+from .tickers import get_indexed_us_tickers, search_us_tickers
 from .polygon_client import PolygonClient
 
+try:
+    import orjson
+except ImportError:  # optional: FastJsonResponse falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: nearest-strike search falls back to a pure-Python scan
+    np = None
+
 logger = logging.getLogger(__name__)
 
 TRADINGVIEW_SYMBOL_SEARCH_URL = "https://symbol-search.tradingview.com/symbol_search/"
 US_STOCK_EXCHANGES = {"NASDAQ", "NYSE", "AMEX"}
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 
+# Shared worker pool for overlapping independent Polygon round-trips within a request.
+_POLY_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix="polygon")
+
+# Popular ETFs always offered by the cached ticker list, as (item, upper-cased symbol) pairs.
+_POPULAR_ETFS = tuple(
+    ({"symbol": s, "name": n}, s.upper())
+    for s, n in (
+        ("SPY", "SPDR S&P 500 ETF Trust"),
+        ("QQQ", "Invesco QQQ Trust"),
+        ("IWM", "iShares Russell 2000 ETF"),
+        ("DIA", "SPDR Dow Jones Industrial Average ETF"),
+        ("VOO", "Vanguard S&P 500 ETF"),
+    )
+)
+
+# Shared session for Yahoo Finance lookups so repeated calls reuse pooled keep-alive connections.
+_YF_SESSION = requests.Session()
+_YF_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+})
+_YF_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.1)),
+)
+
+
+@lru_cache(maxsize=None)
+def _polygon_api_key() -> str:
+    """POLYGON_API_KEY resolved once per process (settings don't change at runtime)."""
+    return getattr(settings, "POLYGON_API_KEY", "") or ""
+
+
+@lru_cache(maxsize=None)
+def _debug_enabled() -> bool:
+    """settings.DEBUG resolved once per process."""
+    return bool(getattr(settings, "DEBUG", False))
+
+
+@lru_cache(maxsize=4)
+def _get_polygon_client(api_key: str) -> PolygonClient:
+    """Shared PolygonClient per API key, so its pooled session stays warm across requests."""
+    return PolygonClient(api_key)
+
+
+_DJANGO_JSON_ENCODER = DjangoJSONEncoder()
+# Decoder for large upstream payloads; both accept bytes and raise ValueError on bad input.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class FastJsonResponse(HttpResponse):
+    """
+    JsonResponse equivalent serialized with orjson when it is installed.
+    Types orjson can't handle natively (e.g. Decimal) go through DjangoJSONEncoder,
+    so the output matches JsonResponse for the payloads used here.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        if orjson is not None:
+            content = orjson.dumps(
+                data,
+                default=_DJANGO_JSON_ENCODER.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        else:
+            content = json.dumps(data, cls=DjangoJSONEncoder)
+        super().__init__(content=content, **kwargs)
+
+# Shared session for Discord webhook POSTs: keeps the TLS connection to discord.com alive between
+# signals and retries rate limits / transient 5xx (webhook POSTs are safe to resend on those).
+# Read errors are never retried: Discord may already have posted the message. Connect errors are
+# left to the signal delivery worker, which backs off for longer (see _deliver_signal_worker).
+_DISCORD_SESSION = requests.Session()
+_DISCORD_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            connect=0,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,
+        ),
+    ),
+)
+_DISCORD_TIMEOUT = (3.05, 30)  # (connect, read)
+# Operator-facing explanation for the webhook failures users can fix themselves.
+_DISCORD_STATUS_MSG = {
+    400: "Invalid webhook URL or bad request",
+    401: "Invalid webhook URL",
+    403: "Webhook lacks permissions",
+    404: "Webhook not found",
+}
+
 
 def _tv_headers():
     return {
@@ -133,12 +259,12 @@ def _search_crypto_tickers_polygon(q: str, *, limit: int) -> list[dict]:
     if not q:
         return []
     
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     if not polygon_key:
         return []
     
     try:
-        client = PolygonClient(polygon_key)
+        client = _get_polygon_client(polygon_key)
         
         # Polygon crypto tickers endpoint: /v3/reference/tickers
         # Search for crypto tickers matching the query
@@ -217,6 +343,7 @@ def _search_crypto_tickers_polygon(q: str, *, limit: int) -> list[dict]:
         return []
 
 
+@lru_cache(maxsize=4096)
 def _normalize_symbol(symbol: str) -> str:
     symbol = (symbol or "").strip().upper()
     # Basic allowlist: alnum plus "." and "-" (BRK.B, BF.B, etc)
@@ -345,23 +472,30 @@ def validate_embed(embed):
 
     return True, total, None
 
-def send_to_discord(signal, file_attachment=None):
-    """Send signal data to Discord channel using user's webhook. file_attachment: optional uploaded file (image/video) for Chart Analysis."""
+def _prepare_discord_message(signal, file_attachment=None):
+    """
+    Render the signal's embed and resolve its webhook.
+    Returns (url, payload, file_part) ready for _post_discord_message, or None (already logged)
+    when the embed is invalid or the user has no webhook; neither is fixed by trying again.
+    """
     # Get the appropriate template based on signal type
     embed = get_signal_template(signal)
     embed = _ensure_embed_disclaimer(embed)
 
+    file_part = None
     if file_attachment:
         file_name = (getattr(file_attachment, "name", None) or "chart_analysis").strip() or "chart_analysis"
         content_type = getattr(file_attachment, "content_type", "") or "application/octet-stream"
         if content_type.startswith("image/"):
             embed["image"] = {"url": f"attachment://{file_name}"}
         # Video is sent as message attachment; no embed.video for webhook
+        file_attachment.seek(0)
+        file_part = (file_name, file_attachment.read(), content_type)
 
     is_valid, _, validation_error = validate_embed(embed)
     if not is_valid:
-        print(f"ERROR: Discord embed validation failed - {validation_error}")
-        return False
+        logger.error("Discord embed validation failed for signal %s: %s", signal.id, validation_error)
+        return None
 
     payload = {"content": "@everyone", "embeds": [embed]}
 
@@ -383,49 +517,112 @@ def send_to_discord(signal, file_attachment=None):
                         if user_profile and user_profile.discord_channel_webhook:
                             url = user_profile.discord_channel_webhook
                         else:
-                            print(f"ERROR: User {signal.user.username} does not have a Discord webhook configured")
-                            return False
+                            logger.error("User %s does not have a Discord webhook configured", signal.user.username)
+                            return None
                     except UserProfile.DoesNotExist:
-                        print(f"ERROR: User {signal.user.username} does not have a profile or Discord channels")
-                        return False
+                        logger.error("User %s does not have a profile or Discord channels", signal.user.username)
+                        return None
     except Exception as e:
-        print(f"ERROR: Failed to get Discord webhook: {e}")
-        return False
+        logger.error("Failed to get Discord webhook for signal %s: %s", signal.id, e)
+        return None
+
+    return url, payload, file_part
 
+
+def _discord_post_never_sent(exc):
+    """True when a webhook POST failed while connecting, i.e. Discord never received it."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    cause = exc.args[0] if exc.args else None
+    # NewConnectionError (refused, DNS failure) is a ConnectTimeoutError subclass.
+    return isinstance(cause, MaxRetryError) and isinstance(cause.reason, ConnectTimeoutError)
+
+
+def _post_discord_message(url, payload, file_part=None):
+    """
+    POST a prepared message once. Returns (sent, retryable): retryable is True only when the
+    connection could not be opened, so resending cannot duplicate the message. HTTP errors are
+    final here (the session has already retried 429/5xx), and so are read errors and timeouts.
+    """
     try:
-        if file_attachment:
-            file_attachment.seek(0)
-            payload_json = json.dumps(payload, ensure_ascii=False)
-            resp = requests.post(
+        if file_part:
+            resp = _DISCORD_SESSION.post(
                 url,
-                data={"payload_json": payload_json},
-                files={"file": (file_name, file_attachment.read(), content_type)},
-                timeout=30,
+                data={"payload_json": json.dumps(payload, ensure_ascii=False)},
+                files={"file": file_part},
+                timeout=_DISCORD_TIMEOUT,
             )
         else:
-            resp = requests.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=30)
+            resp = _DISCORD_SESSION.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=_DISCORD_TIMEOUT)
         resp.raise_for_status()
-        return True
-    except requests.HTTPError as e:
-        error_msg = response.json() if response.text else {}
-        print(f"Failed to send to Discord: {e}")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {error_msg}")
-        
-        # Provide specific guidance based on status code
-        if response.status_code == 401:
-            print("ERROR: Invalid webhook URL")
-        elif resp and resp.status_code == 403:
-            print("ERROR: Webhook lacks permissions")
-        elif resp and resp.status_code == 404:
-            print("ERROR: Webhook not found")
-        elif resp and resp.status_code == 400:
-            print("ERROR: Invalid webhook URL or bad request")
-        
-        return False
+        return True, False
+    except requests.HTTPError:
+        status = resp.status_code
+        logger.error("Discord webhook failed: %s (HTTP %s)", _DISCORD_STATUS_MSG.get(status, "HTTP error"), status)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Discord response body: %s", resp.text[:1000])
+        return False, False
     except requests.RequestException as e:
-        print(f"Failed to send to Discord: {e}")
+        retryable = _discord_post_never_sent(e)
+        logger.error("Failed to send to Discord%s: %s", " (will retry)" if retryable else "", e)
+        return False, retryable
+
+
+def send_to_discord(signal, file_attachment=None):
+    """Send signal data to Discord channel using user's webhook. file_attachment: optional uploaded file (image/video) for Chart Analysis."""
+    message = _prepare_discord_message(signal, file_attachment=file_attachment)
+    if message is None:
         return False
+    sent, _ = _post_discord_message(*message)
+    return sent
+
+
+# Background pool for Discord webhook delivery (the project runs background work on threads,
+# see signals/apps.py, rather than a task queue).
+_DISCORD_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="discord")
+_DISCORD_SEND_ATTEMPTS = 3
+
+
+def _deliver_signal_worker(signal_id, attachment):
+    from django.db import connection
+    try:
+        signal = Signal.objects.select_related("signal_type", "user__profile", "discord_channel").get(id=signal_id)
+        # Render once: retries resend the same message rather than re-fetching quotes for the embed.
+        message = _prepare_discord_message(signal, file_attachment=attachment)
+        if message is None:
+            return
+        for attempt in range(_DISCORD_SEND_ATTEMPTS):
+            sent, retryable = _post_discord_message(*message)
+            if sent:
+                return
+            if not retryable:
+                logger.warning("Discord delivery failed for signal %s", signal_id)
+                return
+            if attempt + 1 < _DISCORD_SEND_ATTEMPTS:
+                time.sleep(2 ** (attempt + 1))
+        logger.warning("Discord delivery failed for signal %s after %s attempts", signal_id, _DISCORD_SEND_ATTEMPTS)
+    except Exception as e:
+        logger.exception("Discord delivery failed for signal %s: %s", signal_id, e)
+    finally:
+        connection.close()
+
+
+def deliver_signal_to_discord(signal_id, file_attachment=None):
+    """
+    Queue send_to_discord for a saved signal and return immediately.
+    An uploaded attachment is read into memory first, since the request's file is closed
+    once the response is sent. Sends that fail to connect are retried with exponential backoff.
+    """
+    attachment = None
+    if file_attachment:
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        file_attachment.seek(0)
+        attachment = SimpleUploadedFile(
+            getattr(file_attachment, "name", None) or "chart_analysis",
+            file_attachment.read(),
+            content_type=getattr(file_attachment, "content_type", "") or "application/octet-stream",
+        )
+    return _DISCORD_EXEC.submit(_deliver_signal_worker, signal_id, attachment)
 
 
 def _send_discord_embed(url, embed):
@@ -437,13 +634,14 @@ def _send_discord_embed(url, embed):
         e = _ensure_embed_disclaimer(embed or {})
         # @everyone in content (outside embed), not in embed footer
         payload = {"content": "@everyone", "embeds": [e]}
-        resp = requests.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=30)
+        resp = _DISCORD_SESSION.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=_DISCORD_TIMEOUT)
         resp.raise_for_status()
         return True
     except Exception:
         return False
 
 
+@lru_cache(maxsize=64)
 def hex_to_int(color_hex):
     """Convert hex color string to integer"""
     try:
@@ -468,10 +666,10 @@ def _get_stock_price(symbol: str, quote_cache=None):
 
     price = None
 
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     if polygon_key:
         try:
-            client = PolygonClient(polygon_key)
+            client = _get_polygon_client(polygon_key)
             q = client.get_latest_quote(sym)
             if q and q.get("p") is not None:
                 price = float(q["p"])
@@ -501,11 +699,11 @@ def _get_company_name(symbol: str, info_cache=None) -> str:
     if cache is not None and key in cache:
         return cache[key] or ""
 
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     name = ""
     if polygon_key:
         try:
-            client = PolygonClient(polygon_key)
+            client = _get_polygon_client(polygon_key)
             name = client.get_company_name(sym) or ""
         except Exception:
             name = ""
@@ -516,6 +714,94 @@ def _get_company_name(symbol: str, info_cache=None) -> str:
     return name
 
 
+# {{variable}} / {{variable::modifier}} placeholders, compiled once.
+_VAR_RE = re.compile(r"\{\{(\w+)(?:::(\w+))?\}\}")
+
+_TP_LEVELS = range(1, 7)
+# Money values formatted with two decimals ("0.00" when missing/invalid).
+_PRICE_MODIFIERS = frozenset(["option_price", "sl_price", *(f"tp{i}_price" for i in _TP_LEVELS)])
+# Underlying targets: two decimals, but blank stays blank.
+_STOCK_PRICE_MODIFIERS = frozenset(f"tp{i}_stock_price" for i in _TP_LEVELS)
+# Percentages: always rendered with a trailing "%".
+_PERCENT_MODIFIERS = frozenset([
+    "sl_per",
+    *(f"tp{i}_per" for i in _TP_LEVELS),
+    *(f"tp{i}_takeoff_per" for i in _TP_LEVELS),
+])
+# Convenience: allow "namespaced" access like {{ticker::strike}} meaning {{strike}}.
+_ALIAS_MODIFIERS = frozenset([
+    "is_shares",
+    "strike",
+    "expiration",
+    "option_type",
+    *(f"tp{i}_mode" for i in _TP_LEVELS),
+]) | _PRICE_MODIFIERS | _STOCK_PRICE_MODIFIERS | _PERCENT_MODIFIERS
+
+
+def _resolve_placeholder(var_name, modifier, variables, quote_cache=None):
+    """Value for one {{var_name}} / {{var_name::modifier}} placeholder."""
+    if modifier is None:
+        return str(variables.get(var_name, ""))
+
+    if modifier == "stock_price":
+        # Convention: ticker variable holds a symbol string.
+        symbol = variables.get(var_name, "")
+        price = _get_stock_price(str(symbol or ""), quote_cache=quote_cache)
+        # Default when unavailable: 0.00
+        return f"{price:.2f}" if isinstance(price, (int, float)) else "0.00"
+
+    if modifier == "company_name":
+        symbol = variables.get(var_name, "")
+        return _get_company_name(str(symbol or ""), info_cache=quote_cache)
+
+    # (The base name is ignored; modifier is treated as the target variable.)
+    if modifier in _ALIAS_MODIFIERS:
+        val = variables.get(modifier, "")
+        if modifier in _PRICE_MODIFIERS:
+            try:
+                return f"{float(val):.2f}"
+            except Exception:
+                return "0.00"
+        if modifier in _STOCK_PRICE_MODIFIERS:
+            try:
+                s = str(val).strip()
+                if not s:
+                    return ""
+                return f"{float(s):.2f}"
+            except Exception:
+                return str(val) if val is not None else ""
+        if modifier in _PERCENT_MODIFIERS:
+            s = str(val).strip() if val is not None else ""
+            if not s:
+                return "0%"
+            return s if s.endswith("%") else f"{s}%"
+        return str(val) if val is not None else ""
+
+    return str(variables.get(var_name, ""))
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template_string):
+    """
+    Parse a template once into (literals, placeholders) with len(literals) == len(placeholders) + 1;
+    each placeholder is a (var_name, modifier) pair, modifier None for a plain {{var}}.
+    Keyed on the template text itself, so an edited SignalType template simply compiles anew.
+    """
+    parts = _VAR_RE.split(template_string)
+    return tuple(parts[0::3]), tuple(zip(parts[1::3], parts[2::3]))
+
+
+def _render_compiled(literals, placeholders, variables, quote_cache=None):
+    out = [literals[0]]
+    for i, (var_name, modifier) in enumerate(placeholders):
+        if modifier is None:
+            out.append(str(variables.get(var_name, "")))
+        else:
+            out.append(_resolve_placeholder(var_name, modifier, variables, quote_cache))
+        out.append(literals[i + 1])
+    return "".join(out)
+
+
 def render_template(template_string, variables, quote_cache=None):
     """
     Render template string by replacing {{variable}} placeholders with actual values.
@@ -525,102 +811,43 @@ def render_template(template_string, variables, quote_cache=None):
     """
     if not template_string:
         return ""
+    if "{{" not in template_string:
+        return template_string
+    if not isinstance(variables, dict):
+        variables = {}
+    # Replace {{variable}} and {{variable::modifier}} patterns using the cached parse.
+    literals, placeholders = _compile_template(template_string)
+    if not placeholders:
+        return template_string
+    return _render_compiled(literals, placeholders, variables, quote_cache)
+
+def _render_field(field, variables, quote_cache=None):
+    """Render one embed field, or None when it should be dropped (see render_fields_template)."""
+    name_template = field.get('name', '')
+    value_template = field.get('value', '')
+    name = render_template(name_template, variables, quote_cache=quote_cache)
+    value = render_template(value_template, variables, quote_cache=quote_cache)
+    name_stripped = name.strip()
+    value_stripped = value.strip()
+    # Skip field only if BOTH name and value are empty after rendering
+    # This allows for:
+    # 1. Spacer fields: {'name': '', 'value': '\u200b'} - have value, so included
+    # 2. Label-only fields: {'name': 'Label', 'value': ''} - have name, so included
+    # 3. Variable-in-name fields: {'name': 'Target: {{targets}}', 'value': ''} - have name, so included
+    # 4. Empty variable fields: variable not set results in empty name+value - excluded
+    if not (name_stripped or value_stripped):
+        return None
+    # A non-empty template that rendered to nothing means its variable was not set.
+    if (not name_stripped and name_template) or (not value_stripped and value_template):
+        return None
+    return {
+        "name": name,
+        "value": value,
+        "inline": field.get('inline', False),
+        "optional": field.get('optional', False),
+        "_blank": not name_stripped and value_stripped in ('', '\u200b'),
+    }
 
-    def replace_var(match):
-        var_name = (match.group(1) or "").strip()
-        modifier = (match.group(2) or "").strip()
-
-        if modifier == "stock_price":
-            # Convention: ticker variable holds a symbol string.
-            symbol = variables.get(var_name, "") if isinstance(variables, dict) else ""
-            price = _get_stock_price(str(symbol or ""), quote_cache=quote_cache)
-            # Default when unavailable: 0.00
-            return f"{price:.2f}" if isinstance(price, (int, float)) else "0.00"
-
-        if modifier == "company_name":
-            symbol = variables.get(var_name, "") if isinstance(variables, dict) else ""
-            return _get_company_name(str(symbol or ""), info_cache=quote_cache)
-
-        # Convenience: allow "namespaced" access like {{ticker::strike}} meaning {{strike}}.
-        # (The base name is ignored; modifier is treated as the target variable.)
-        if modifier in (
-            "is_shares",
-            "strike",
-            "expiration",
-            "option_type",
-            "option_price",
-            "tp1_mode",
-            "tp2_mode",
-            "tp3_mode",
-            "tp4_mode",
-            "tp5_mode",
-            "tp6_mode",
-            "tp1_per",
-            "tp2_per",
-            "tp3_per",
-            "tp4_per",
-            "tp5_per",
-            "tp6_per",
-            "tp1_stock_price",
-            "tp2_stock_price",
-            "tp3_stock_price",
-            "tp4_stock_price",
-            "tp5_stock_price",
-            "tp6_stock_price",
-            "tp1_takeoff_per",
-            "tp2_takeoff_per",
-            "tp3_takeoff_per",
-            "tp4_takeoff_per",
-            "tp5_takeoff_per",
-            "tp6_takeoff_per",
-            "sl_per",
-            "tp1_price",
-            "tp2_price",
-            "tp3_price",
-            "tp4_price",
-            "tp5_price",
-            "tp6_price",
-            "sl_price",
-        ):
-            val = variables.get(modifier, "") if isinstance(variables, dict) else ""
-            if modifier in ("option_price", "tp1_price", "tp2_price", "tp3_price", "tp4_price", "tp5_price", "tp6_price", "sl_price"):
-                try:
-                    return f"{float(val):.2f}"
-                except Exception:
-                    return "0.00"
-            if modifier in ("tp1_stock_price", "tp2_stock_price", "tp3_stock_price", "tp4_stock_price", "tp5_stock_price", "tp6_stock_price"):
-                try:
-                    s = str(val).strip()
-                    if not s:
-                        return ""
-                    return f"{float(s):.2f}"
-                except Exception:
-                    return str(val) if val is not None else ""
-            if modifier in (
-                "tp1_per",
-                "tp2_per",
-                "tp3_per",
-                "tp4_per",
-                "tp5_per",
-                "tp6_per",
-                "tp1_takeoff_per",
-                "tp2_takeoff_per",
-                "tp3_takeoff_per",
-                "tp4_takeoff_per",
-                "tp5_takeoff_per",
-                "tp6_takeoff_per",
-                "sl_per",
-            ):
-                s = str(val).strip() if val is not None else ""
-                if not s:
-                    return "0%"
-                return s if s.endswith("%") else f"{s}%"
-            return str(val) if val is not None else ""
-
-        return str(variables.get(var_name, "")) if isinstance(variables, dict) else ""
-
-    # Replace {{variable}} and {{variable::modifier}} patterns
-    return re.sub(r"\{\{(\w+)(?:::(\w+))?\}\}", replace_var, template_string)
 
 def render_fields_template(fields_template, variables, optional_fields_indices=None, quote_cache=None):
     """Render fields template from JSONField
@@ -636,65 +863,29 @@ def render_fields_template(fields_template, variables, optional_fields_indices=N
     # Convert optional_fields_indices to set for faster lookup
     optional_indices_set = set(optional_fields_indices) if optional_fields_indices else None
     
-    # First pass: determine which fields will be included (for blank spacer detection)
-    included_indices = set()
-    for index, field in enumerate(fields_template):
-        # Skip optional fields that are not in the selected indices
-        if field.get('optional', False):
-            if optional_indices_set is None or index not in optional_indices_set:
-                continue  # Skip this optional field
-        included_indices.add(index)
-    
-    rendered_fields = []
-    for index, field in enumerate(fields_template):
-        # Skip optional fields that are not in the selected indices
-        if field.get('optional', False):
-            if optional_indices_set is None or index not in optional_indices_set:
-                continue  # Skip this optional field
-        
-        rendered_field = {
-            "name": render_template(field.get('name', ''), variables, quote_cache=quote_cache),
-            "value": render_template(field.get('value', ''), variables, quote_cache=quote_cache),
-            "inline": field.get('inline', False),
-            "optional": field.get('optional', False)
-        }
-        # Clean up the rendered values
-        rendered_name = rendered_field["name"].strip() if rendered_field["name"] else ""
-        rendered_value = rendered_field["value"].strip() if rendered_field["value"] else ""
-        
-        # Skip field only if BOTH name and value are empty after rendering
-        # This allows for:
-        # 1. Spacer fields: {'name': '', 'value': '\u200b'} - have value, so included
-        # 2. Label-only fields: {'name': 'Label', 'value': ''} - have name, so included
-        # 3. Variable-in-name fields: {'name': 'Target: {{targets}}', 'value': ''} - have name, so included
-        # 4. Empty variable fields: variable not set results in empty name+value - excluded
-        if rendered_name or rendered_value:
-            if rendered_name == "" and field.get('name', ''):
-                continue
-            if rendered_value == "" and field.get('value', ''):
-                continue
-            rendered_fields.append(rendered_field)
+    # Optional fields are only rendered when their index was selected
+    rendered_fields = [
+        rendered
+        for index, field in enumerate(fields_template)
+        if not field.get('optional', False) or (optional_indices_set and index in optional_indices_set)
+        if (rendered := _render_field(field, variables, quote_cache)) is not None
+    ]
     
     # Remove consecutive blank spacers (keep only one)
     filtered_fields = []
     prev_was_blank = False
     for field in rendered_fields:
-        is_blank = (not field["name"].strip() and 
-                   (not field["value"].strip() or field["value"].strip() == '\u200b'))
+        is_blank = field.pop("_blank")
         if is_blank and prev_was_blank:
             continue  # Skip consecutive blank spacers
         prev_was_blank = is_blank
-        filtered_fields.append(field)
+        filtered_fields.append((field, is_blank))
     
     # Remove trailing blank spacers
-    while filtered_fields:
-        last_field = filtered_fields[-1]
-        if not last_field["name"].strip() and (not last_field["value"].strip() or last_field["value"].strip() == '\u200b'):
-            filtered_fields.pop()
-        else:
-            break
+    while filtered_fields and filtered_fields[-1][1]:
+        filtered_fields.pop()
     
-    return filtered_fields
+    return [field for field, _ in filtered_fields]
 
 def get_signal_template(signal):
     """Generate Discord embed template from signal"""
@@ -1273,19 +1464,16 @@ def user_logout(request):
     return redirect('user_login')
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def profile(request):
     """User profile view - allows users to update their own profile"""
     user = request.user
     
     # Get or create profile with default values
-    try:
-        profile = UserProfile.objects.get(user=user)
-    except UserProfile.DoesNotExist:
-        profile = UserProfile.objects.create(
-            user=user,
-            discord_channel_name='',
-            discord_channel_webhook=''
-        )
+    profile, _ = UserProfile.objects.get_or_create(
+        user=user,
+        defaults={'discord_channel_name': '', 'discord_channel_webhook': ''},
+    )
     
     password_form = PasswordChangeForm(user=user)
     email_value = user.email
@@ -1313,7 +1501,7 @@ def profile(request):
                     messages.error(request, error)
             else:
                 user.email = email_value
-                user.save()
+                user.save(update_fields=['email'])
                 messages.success(request, 'Profile updated successfully!')
                 return redirect('profile')
 
@@ -1447,11 +1635,11 @@ def post_ta(request):
     payload_json = json.dumps(payload)
     try:
         ta_file.seek(0)
-        resp = requests.post(
+        resp = _DISCORD_SESSION.post(
             channel.webhook_url,
             data={"payload_json": payload_json},
             files={"file": (file_name, ta_file.read(), content_type)},
-            timeout=30,
+            timeout=_DISCORD_TIMEOUT,
         )
         resp.raise_for_status()
     except requests.RequestException as e:
@@ -1589,29 +1777,40 @@ def saved_trade_plans(request):
     )
 
 
+def _signal_types_data(user):
+    """
+    Signal types visible to `user`, shaped for the dashboard's json_script payload.
+    Read as plain dicts (no model instances); JSONFields arrive already decoded and
+    are serialized exactly once by the template.
+    """
+    rows = SignalType.objects.filter(Q(user__isnull=True) | Q(user=user)).order_by('id').values(
+        'id', 'name', 'variables', 'title_template', 'description_template', 'footer_template',
+        'color', 'fileds_template', 'show_title_default', 'show_description_default',
+    )
+    return [
+        {
+            'id': r['id'],
+            'name': r['name'] or '',
+            'variables': r['variables'] or [],
+            'title_template': r['title_template'] or '',
+            'description_template': r['description_template'] or '',
+            'footer_template': r['footer_template'] or '',
+            'color': r['color'] or '#000000',
+            'fields_template': r['fileds_template'] or [],
+            'show_title_default': r['show_title_default'],
+            'show_description_default': r['show_description_default'],
+        }
+        for r in rows
+    ]
+
+
 @login_required
 @require_GET
 def new_trade_plan(request):
     """New Trade Plan page: dashboard template with only Trade Plan panel and preview (trade_plan_only=True)."""
-    form = SignalForm(user=request.user)
+    signal_types_data = _signal_types_data(request.user)
+    form = SignalForm(user=request.user, signal_types=signal_types_data)
     recent_signals = []
-    signal_types = SignalType.objects.filter(
-        Q(user__isnull=True) | Q(user=request.user)
-    )
-    signal_types_data = []
-    for st in signal_types:
-        signal_types_data.append({
-            "id": st.id,
-            "name": st.name or "",
-            "variables": st.variables or [],
-            "title_template": st.title_template or "",
-            "description_template": st.description_template or "",
-            "footer_template": st.footer_template or "",
-            "color": st.color or "#000000",
-            "fields_template": st.fileds_template or [],
-            "show_title_default": getattr(st, "show_title_default", True),
-            "show_description_default": getattr(st, "show_description_default", True),
-        })
     discord_channels = DiscordChannel.objects.filter(
         user=request.user, is_active=True
     ).order_by("-is_default", "channel_name")
@@ -1652,25 +1851,11 @@ def new_trade_plan(request):
     })
 
 
-def _get_dashboard_context(request, form):
+def _get_dashboard_context(request, form, signal_types_data=None):
     """Build context dict for dashboard template (form, signal_types_data, discord_channels, presets)."""
     recent_signals = []
-    signal_types = SignalType.objects.filter(Q(user__isnull=True) | Q(user=request.user))
-    signal_types_data = [
-        {
-            'id': st.id,
-            'name': st.name or '',
-            'variables': st.variables or [],
-            'title_template': st.title_template or '',
-            'description_template': st.description_template or '',
-            'footer_template': st.footer_template or '',
-            'color': st.color or '#000000',
-            'fields_template': st.fileds_template or [],
-            'show_title_default': getattr(st, 'show_title_default', True),
-            'show_description_default': getattr(st, 'show_description_default', True),
-        }
-        for st in signal_types
-    ]
+    if signal_types_data is None:
+        signal_types_data = _signal_types_data(request.user)
     discord_channels = DiscordChannel.objects.filter(user=request.user, is_active=True).order_by('-is_default', 'channel_name')
     presets = []
     try:
@@ -1688,6 +1873,7 @@ def _get_dashboard_context(request, form):
 
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def dashboard(request):
     if request.method == 'POST':
         form = SignalForm(request.POST, request.FILES, user=request.user)
@@ -1744,13 +1930,13 @@ def dashboard(request):
                 if not is_shares:
                     sym = _normalize_symbol(signal_data.get('ticker') or signal_data.get('symbol') or '')
                     if sym and _is_zero_price(signal_data.get('option_price')):
-                        polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+                        polygon_key = _polygon_api_key()
                         if polygon_key:
                             side_raw = str(signal_data.get('option_type') or 'CALL').strip().lower()
                             side = 'put' if 'put' in side_raw else 'call'
                             tt = str(signal_data.get('trade_type') or 'swing').strip().lower() or 'swing'
 
-                            client = PolygonClient(polygon_key)
+                            client = _get_polygon_client(polygon_key)
                             underlying_price = client.get_share_current_price(sym)
                             if underlying_price is not None:
                                 import datetime as dt
@@ -1929,18 +2115,12 @@ def dashboard(request):
                         logger.warning('IBKR push entry failed for position %s: %s', created.id, ibkr_e)
                 except Exception as e:
                     logger.warning('Could not create position for signal %s: %s', signal_instance.id, e)
-                success = send_to_discord(signal_instance, file_attachment=chart_file)
-                
-                if success:
-                    messages.success(
-                        request,
-                        'Signal submitted and sent to Discord successfully!'
-                    )
-                else:
-                    messages.warning(
-                        request,
-                        'Signal saved but failed to send to Discord. Please ensure your user profile has a Discord webhook configured.'
-                    )
+                # Discord delivery runs in the background so the POST doesn't wait on the webhook.
+                deliver_signal_to_discord(signal_instance.id, file_attachment=chart_file)
+                messages.success(
+                    request,
+                    'Signal submitted! It is being sent to Discord.'
+                )
                 if not ibkr_ok and ibkr_error:
                     messages.warning(
                         request,
@@ -1949,7 +2129,9 @@ def dashboard(request):
                     return redirect(reverse('dashboard') + '?ibkr_failed=1')
                 return redirect('dashboard')
     else:
-        form = SignalForm(user=request.user)
+        signal_types_data = _signal_types_data(request.user)
+        form = SignalForm(user=request.user, signal_types=signal_types_data)
+        return render(request, 'signals/dashboard.html', _get_dashboard_context(request, form, signal_types_data))
     
     return render(request, 'signals/dashboard.html', _get_dashboard_context(request, form))
 
@@ -2149,9 +2331,23 @@ def trade_plan_api(request):
     return JsonResponse({"error": "Invalid action"}, status=400)
 
 @login_required
+@require_GET
 def signals_history(request):
     """View all submitted signals for current user"""
-    signals = Signal.objects.filter(user=request.user).select_related('signal_type', 'user').all().order_by('-created_at')
+    # The table shows four keys of `data`; pull those out in SQL instead of loading the whole blob.
+    # A missing key reads as '' (not NULL) so the cell stays empty, as it did with signal.data.<key>.
+    signals = (
+        Signal.objects.filter(user=request.user)
+        .select_related('signal_type')
+        .only('id', 'created_at', 'signal_type__name')
+        .annotate(
+            ticker=Coalesce(KeyTextTransform('ticker', 'data'), Value('')),
+            strike=Coalesce(KeyTextTransform('strike', 'data'), Value('')),
+            expiration=Coalesce(KeyTextTransform('expiration', 'data'), Value('')),
+            extra_info=Coalesce(KeyTextTransform('extra_info', 'data'), Value('')),
+        )
+        .order_by('-created_at')
+    )
     
     # Filter by signal type if provided
     signal_type = request.GET.get('type')
@@ -2716,7 +2912,7 @@ def _get_position_current_price(pos, bypass_cache=False):
         pos: Position instance
         bypass_cache: If True, bypasses quote cache to get fresh prices (for live updates)
     """
-    polygon_key = getattr(settings, "POLYGON_API_KEY", None) or ""
+    polygon_key = _polygon_api_key()
     if not polygon_key:
         logger.debug("Position current price: POLYGON_API_KEY not set")
         return None
@@ -2724,7 +2920,7 @@ def _get_position_current_price(pos, bypass_cache=False):
         logger.debug("Position current price: position has no symbol (id=%s)", getattr(pos, "id", None))
         return None
     try:
-        client = PolygonClient(polygon_key)
+        client = _get_polygon_client(polygon_key)
         if pos.instrument == Position.INSTRUMENT_SHARES:
             price = client.get_share_current_price(pos.symbol, bypass_cache=bypass_cache)
             if price is not None:
@@ -2882,7 +3078,7 @@ def position_management(request):
     """List open and closed positions for the current user. Paginated: 5 per page."""
     from django.utils import timezone
     open_qs = Position.objects.filter(user=request.user, status=Position.STATUS_OPEN).select_related("signal").order_by("-opened_at")
-    closed_qs = Position.objects.filter(user=request.user, status=Position.STATUS_CLOSED).select_related("signal").order_by("-closed_at", "-opened_at")
+    closed_qs = Position.objects.filter(user=request.user, status=Position.STATUS_CLOSED).order_by("-closed_at", "-opened_at")
 
     open_paginator = Paginator(open_qs, 5)
     open_page = open_paginator.get_page(request.GET.get("page", 1))
@@ -2989,24 +3185,34 @@ def position_management(request):
             "current_raise_sl_custom_stock": current_raise_sl_custom_stock,
         })
     closed_positions = []
-    for p in closed_qs:
-        entry = float(p.entry_price) if p.entry_price is not None else 0
-        exit_p = float(p.exit_price) if p.exit_price is not None else 0
-        qty = _get_display_qty(p)
+    _fmt2 = "{:.2f}".format
+    _fmtpct = "{:+.1f}%".format
+    # Closed rows only feed the summary table; read plain dicts with prices already cast to float in SQL.
+    for p in closed_qs.annotate(
+        entry_f=Cast("entry_price", FloatField()),
+        exit_f=Cast("exit_price", FloatField()),
+    ).values(
+        "id", "symbol", "instrument", "option_type", "strike", "expiration",
+        "quantity", "multiplier", "entry_f", "exit_f", "closed_at",
+    ):
+        entry = p["entry_f"] or 0
+        exit_p = p["exit_f"] or 0
+        # Same as get_display_qty(): quantity * multiplier, at least 1.
+        qty = max(1, int(p["quantity"] or 1) * int(p["multiplier"] or 100))
         pnl_pct = (100 * (exit_p - entry) / entry) if entry and exit_p else None
         closed_positions.append({
-            "id": p.id,
-            "symbol": p.symbol,
-            "instrument": p.instrument,
-            "option_type": p.option_type,
-            "strike": p.strike,
-            "expiration": p.expiration,
+            "id": p["id"],
+            "symbol": p["symbol"],
+            "instrument": p["instrument"],
+            "option_type": p["option_type"],
+            "strike": p["strike"],
+            "expiration": p["expiration"],
             "display_qty": qty,
-            "entry_str": f"{entry:.2f}" if entry else "-",
-            "exit_str": f"{exit_p:.2f}" if exit_p else "-",
+            "entry_str": _fmt2(entry) if entry else "-",
+            "exit_str": _fmt2(exit_p) if exit_p else "-",
             "pnl_pct": pnl_pct,
-            "pnl_pct_str": f"{pnl_pct:+.1f}%" if pnl_pct is not None else "-",
-            "closed_at": p.closed_at,
+            "pnl_pct_str": _fmtpct(pnl_pct) if pnl_pct is not None else "-",
+            "closed_at": p["closed_at"],
         })
     return render(request, "signals/positions.html", {
         "open_positions": open_positions,
@@ -3027,28 +3233,35 @@ def positions_live(request):
     open_qs = Position.objects.filter(
         user=request.user,
         status=Position.STATUS_OPEN,
-    ).select_related("signal").order_by("-opened_at")
+    ).only(
+        "id", "symbol", "instrument", "option_contract", "quantity", "multiplier",
+    ).annotate(
+        entry_f=Cast("entry_price", FloatField()),
+        realized_f=Cast("realized_pnl", FloatField()),
+    ).order_by("-opened_at")
     from signals.ibkr import get_display_qty
     positions = []
+    _fmt2 = "{:.2f}".format
+    _fmtpct = "{:+.1f}%".format
     for p in open_qs:
-        entry = float(p.entry_price) if p.entry_price is not None else 0
+        entry = p.entry_f or 0
         qty = get_display_qty(p)
         # Use bypass_cache=True for live updates to get fresh prices
         mark_val = _get_position_current_price(p, bypass_cache=True)
         pnl_pct = (100 * (mark_val - entry) / entry) if entry and mark_val is not None else None
-        realized = float(p.realized_pnl) if p.realized_pnl is not None else 0
+        realized = p.realized_f or 0
         realized_pct = (100 * realized / (entry * qty)) if entry and qty else None
         status_kind = "good" if (pnl_pct or 0) >= 0 else "bad"
         realized_kind = "good" if (realized_pct or 0) >= 0 else "bad"
         positions.append({
             "id": p.id,
-            "mark_str": f"{mark_val:.2f}" if mark_val is not None else "-",
-            "pnl_pct_str": f"{pnl_pct:+.1f}%" if pnl_pct is not None else "-",
+            "mark_str": _fmt2(mark_val) if mark_val is not None else "-",
+            "pnl_pct_str": _fmtpct(pnl_pct) if pnl_pct is not None else "-",
             "status_kind": status_kind,
-            "realized_pnl_pct_str": f"{realized_pct:+.1f}%" if realized_pct is not None else "-",
+            "realized_pnl_pct_str": _fmtpct(realized_pct) if realized_pct is not None else "-",
             "realized_kind": realized_kind,
         })
-    return JsonResponse({"positions": positions})
+    return FastJsonResponse({"positions": positions})
 
 
 @login_required
@@ -3069,8 +3282,7 @@ def leaderboard(request):
     now = timezone.now()
     if period == "week":
         start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        while start.weekday() != 0:
-            start = start - timedelta(days=1)
+        start = start - timedelta(days=start.weekday())
         if which == "last":
             start = start - timedelta(days=7)
         end = start + timedelta(days=7)
@@ -3181,8 +3393,8 @@ def close_position(request, position_id):
     if not pos:
         return JsonResponse({"error": "Position not found"}, status=404)
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
-    except Exception:
+        payload = json.loads(request.body) if request.body else {}
+    except ValueError:  # JSONDecodeError or undecodable bytes
         payload = {}
     exit_price_raw = payload.get("exit_price")
     try:
@@ -3232,8 +3444,8 @@ def post_position_update(request, position_id):
     if not pos:
         return JsonResponse({"error": "Position not found"}, status=404)
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
-    except Exception:
+        payload = json.loads(request.body) if request.body else {}
+    except ValueError:  # JSONDecodeError or undecodable bytes
         payload = {}
     
     # Handle option contract update (for editing contract in position management)
@@ -3402,23 +3614,14 @@ def position_preview(request, position_id):
         params = {}
         takeoff_raw = data.get(f"tp{next_tp}_takeoff_per")
         if takeoff_raw is not None:
-            try:
-                params["reduce_percent"] = str(takeoff_raw).strip().replace("%", "")
-            except:
-                pass
+            params["reduce_percent"] = str(takeoff_raw).strip().rstrip("%")
         # Next target is for TP{next_tp + 1}, not TP{next_tp}
         next_tp_per_raw = data.get(f"tp{next_tp + 1}_per")
         if next_tp_per_raw is not None:
-            try:
-                params["next_target_percent"] = str(next_tp_per_raw).strip().replace("%", "")
-            except:
-                pass
+            params["next_target_percent"] = str(next_tp_per_raw).strip().rstrip("%")
         next_tp_price_raw = data.get(f"tp{next_tp + 1}_price") or data.get(f"tp{next_tp + 1}_stock_price")
         if next_tp_price_raw is not None:
-            try:
-                params["next_target_value"] = str(next_tp_price_raw).strip()
-            except:
-                pass
+            params["next_target_value"] = str(next_tp_price_raw).strip()
         # Get TP mode to determine which custom inputs to show (for next TP level)
         tp_mode_raw = str(data.get(f"tp{next_tp + 1}_mode") or "").strip().lower()
         is_stock_mode = tp_mode_raw in ("stock", "stock_price", "underlying", "share_price")
@@ -3432,15 +3635,19 @@ def position_preview(request, position_id):
                 params["raise_sl_to"] = "entry"
             elif raise_sl_val == "custom":
                 params["raise_sl_to"] = "custom"
-                params["raise_sl_custom_per"] = str(data.get(f"tp{next_tp}_raise_sl_custom_per") or "").strip()
-                params["raise_sl_custom_price"] = str(data.get(f"tp{next_tp}_raise_sl_custom") or "").strip()
-                params["raise_sl_custom_stock"] = str(data.get(f"tp{next_tp}_raise_sl_custom_stock") or "").strip()
+                for out_key, suffix in (
+                    ("raise_sl_custom_per", "raise_sl_custom_per"),
+                    ("raise_sl_custom_price", "raise_sl_custom"),
+                    ("raise_sl_custom_stock", "raise_sl_custom_stock"),
+                ):
+                    params[out_key] = str(data.get(f"tp{next_tp}_{suffix}") or "").strip()
         embed["_params"] = params
     
-    return JsonResponse(embed)
+    return FastJsonResponse(embed)
 
 
 @login_required
+@require_GET
 def get_signal_type_variables(request):
     """API endpoint to get variables for a specific signal type"""
     signal_type_id = request.GET.get('signal_type_id')
@@ -3448,9 +3655,9 @@ def get_signal_type_variables(request):
         return JsonResponse({'error': 'signal_type_id is required'}, status=400)
     
     try:
-        signal_type = SignalType.objects.get(id=signal_type_id)
+        signal_type = SignalType.objects.only('id', 'user', 'variables').get(id=signal_type_id)
         # Check if user has access to this signal type
-        if signal_type.user and signal_type.user != request.user:
+        if signal_type.user_id and signal_type.user_id != request.user.id:
             return JsonResponse({'error': 'Access denied'}, status=403)
         
         return JsonResponse({
@@ -3517,57 +3724,43 @@ def us_tickers(request):
                 logger.warning(f"Crypto ticker search failed: {e}")
         
         if tickers:
-            # Sort: exact symbol matches first, then prefix matches, then alphabetical
+            # Sort: exact symbol matches first, then prefix matches, then alphabetical.
+            # Ranks are computed in one pass into a parallel list so the sort compares plain
+            # (int, str) keys; the ticker dicts themselves are left untouched.
             q_upper = q.upper()
-            tickers.sort(key=lambda r: (
-                0 if r["symbol"].upper() == q_upper else (1 if r["symbol"].upper().startswith(q_upper) else 2),
-                r["symbol"]
-            ))
+            ranked = [
+                (0 if (su := r["symbol"].upper()) == q_upper else (1 if su.startswith(q_upper) else 2), r["symbol"], r)
+                for r in tickers
+            ]
+            ranked.sort(key=itemgetter(0, 1))
             # Apply limit after combining
             if limit:
-                tickers = tickers[:limit]
-            return JsonResponse({"tickers": tickers, "source": "tradingview"})
+                ranked = ranked[:limit]
+            tickers = [r for _, _, r in ranked]
+            return FastJsonResponse({"tickers": tickers, "source": "tradingview"})
         
         # Continue into cache flow below if no results.
 
-    # Cache flow (fallback or explicit): ensure popular ETFs (SPY, QQQ, etc.) are always in the list
-    POPULAR_ETFS = [
-        {"symbol": "SPY", "name": "SPDR S&P 500 ETF Trust"},
-        {"symbol": "QQQ", "name": "Invesco QQQ Trust"},
-        {"symbol": "IWM", "name": "iShares Russell 2000 ETF"},
-        {"symbol": "DIA", "name": "SPDR Dow Jones Industrial Average ETF"},
-        {"symbol": "VOO", "name": "Vanguard S&P 500 ETF"},
-    ]
-    
-    tickers_all = list(get_us_tickers() or [])
-    seen = {str(t.get("symbol") or "").strip().upper() for t in tickers_all if isinstance(t, dict)}
-    for etf in POPULAR_ETFS:
-        sym = str(etf.get("symbol") or "").strip().upper()
-        if sym and sym not in seen:
-            tickers_all.append(etf)
-            seen.add(sym)
-    tickers = tickers_all
+    # Cache flow (fallback or explicit): ensure popular ETFs (SPY, QQQ, etc.) are always in the list.
+    # Cached tickers come pre-indexed, so only the popular ETFs missing from the cache are added.
+    ts, _, _, seen = get_indexed_us_tickers()
+    extras = [item for item, sym_up in _POPULAR_ETFS if sym_up not in seen]
 
     if q:
         q_upper = q.upper()
         q_lower = q.lower()
-        filtered = []
-        for t in tickers_all:
-            if not isinstance(t, dict):
-                continue
-            sym = str(t.get("symbol") or "").strip().upper()
-            name = str(t.get("name") or "").strip()
-            if not sym:
-                continue
-            if q_upper in sym or (name and q_lower in name.lower()):
-                filtered.append({"symbol": sym, "name": name})
-        filtered.sort(key=lambda r: (0 if r["symbol"].startswith(q_upper) else 1, r["symbol"]))
-        tickers = filtered
-
-    if limit:
-        tickers = tickers[:limit]
+        tickers = search_us_tickers(q_upper, q_lower)
+        for t in extras:
+            if q_upper in t["symbol"] or q_lower in t["name"].lower():
+                tickers.append(t)
+        tickers.sort(key=lambda r: (0 if r["symbol"].startswith(q_upper) else 1, r["symbol"]))
+        if limit:
+            tickers = tickers[:limit]
+    else:
+        # Single pass over cache + extras, stopping at the limit instead of copying the full list.
+        tickers = list(islice(chain(ts, extras), limit or None))
 
-    return JsonResponse({"tickers": tickers, "source": "cache"})
+    return FastJsonResponse({"tickers": tickers, "source": "cache"})
 
 
 @login_required
@@ -3589,22 +3782,24 @@ def quote(request):
     logger.info(f"Quote request for symbol: {symbol}")
 
     # Polygon-only
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     if not polygon_key:
         return JsonResponse(
             {"error": "POLYGON_API_KEY is not set", "source": "polygon"},
             status=502,
         )
 
-    client = PolygonClient(polygon_key)
+    client = _get_polygon_client(polygon_key)
+    # Quote and company name are independent round-trips; overlap them so latency is max(t1, t2).
+    # The quote stays on this thread so client.last_error (tracked per thread) is readable below.
+    f_name = _POLY_EXEC.submit(client.get_company_name, symbol)
     q = client.get_latest_quote(symbol)
-    if q and q.get("p") is not None:
+    try:
+        company_name = f_name.result() or ""
+    except Exception:
         company_name = ""
-        try:
-            company_name = client.get_company_name(symbol) or ""
-        except Exception:
-            company_name = ""
-        return JsonResponse(
+    if q and q.get("p") is not None:
+        return FastJsonResponse(
             {
                 "symbol": symbol,
                 "price": round(float(q.get("p")), 3),
@@ -3617,11 +3812,75 @@ def quote(request):
 
     # Polygon configured but no quote returned
     payload = {"error": "quote fetch failed", "source": "polygon", "symbol": symbol}
-    if getattr(settings, "DEBUG", False):
+    if _debug_enabled():
         payload["polygon_error"] = getattr(client, "last_error", None)
     return JsonResponse(payload, status=502)
 
 
+# Plain decimal numbers only (no exponent / inf / nan), optional sign and surrounding spaces.
+_NUM_RE = re.compile(r"^\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)\s*$")
+
+
+def _to_float_or_none(s):
+    """Parse a query-string number without exception-driven control flow; None if missing or invalid."""
+    return float(s) if s and _NUM_RE.match(s) else None
+
+
+def _dig(obj, path):
+    """Walk nested dicts/lists by key or index; None as soon as a step is missing."""
+    for k in path:
+        if isinstance(obj, dict):
+            obj = obj.get(k)
+        elif isinstance(obj, list) and isinstance(k, int):
+            obj = obj[k] if -len(obj) <= k < len(obj) else None
+        else:
+            return None
+    return obj
+
+
+@lru_cache(maxsize=2048)
+def _epoch_to_ymd(epoch: int) -> str:
+    """UTC YYYY-MM-DD for an epoch (Yahoo expirations); expirations recur, so memoized."""
+    tm = time.gmtime(epoch)
+    return f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+
+
+def _yahoo_chain_contracts(content, side):
+    """
+    Decode a Yahoo options response and return the call/put contracts of the first expiration,
+    or None when the chain has no expirations/options. Only the contract list outlives this call,
+    so the rest of the (often large) decoded tree is released before strike selection.
+    """
+    chain0 = _dig(_json_loads(content) if content else {}, ("optionChain", "result", 0)) or {}
+    if not chain0.get("expirationDates") or not chain0.get("options"):
+        return None
+    # Yahoo returns an options list matching a particular expiration (usually first in response).
+    return _dig(chain0, ("options", 0, "calls" if side == "call" else "puts")) or []
+
+
+def _nearest_strike_contract(contracts, target):
+    """
+    Return the contract whose strike is closest to target (first one wins on ties),
+    or None if no contract has a strike.
+    """
+    # One pass collects (strike, index); target is expected as a float already (callers hoist the cast).
+    pairs = [(k, i) for i, c in enumerate(contracts) if (k := c.get("strike")) is not None]
+    if not pairs:
+        return None
+    if np is not None:
+        # fromiter coerces to float64 itself, so no per-element float() calls.
+        strikes = np.fromiter((k for k, _ in pairs), dtype=np.float64, count=len(pairs))
+        return contracts[pairs[int(np.abs(strikes - target).argmin())][1]]
+    # Yahoo returns strikes ascending (as floats), so this sort is a linear pass; then bisect
+    # and compare only the two neighbours of the insertion point.
+    pairs.sort(key=itemgetter(0))
+    keys = [k for k, _ in pairs]
+    pos = bisect_left(keys, target)
+    if pos == len(keys) or (pos > 0 and target - keys[pos - 1] <= keys[pos] - target):
+        pos = bisect_left(keys, keys[pos - 1])  # first of any duplicate strikes
+    return contracts[pairs[pos][1]]
+
+
 @login_required
 @require_GET
 def option_suggest(request):
@@ -3640,21 +3899,21 @@ def option_suggest(request):
         return JsonResponse({"error": "symbol is required"}, status=400)
 
     # Fetch underlying price first (prefer Polygon if configured; fallback Yahoo)
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     quote_url = "https://query2.finance.yahoo.com/v7/finance/quote"
     opt_url = f"https://query2.finance.yahoo.com/v7/finance/options/{symbol}"
 
     try:
         underlying_price = None
         if polygon_key:
-            client = PolygonClient(polygon_key)
+            client = _get_polygon_client(polygon_key)
             underlying_price = client.get_share_current_price(symbol)
 
         if underlying_price is None:
-            qresp = requests.get(quote_url, params={"symbols": symbol}, timeout=6)
+            qresp = _YF_SESSION.get(quote_url, params={"symbols": symbol}, timeout=6)
             qresp.raise_for_status()
             qpayload = qresp.json() if qresp.content else {}
-            qresult = ((qpayload.get("quoteResponse") or {}).get("result") or [])
+            qresult = _dig(qpayload, ("quoteResponse", "result")) or []
             if not qresult:
                 return JsonResponse({"error": "symbol not found"}, status=404)
             underlying = qresult[0] or {}
@@ -3662,36 +3921,17 @@ def option_suggest(request):
             if underlying_price is None:
                 return JsonResponse({"error": "underlying price unavailable"}, status=502)
 
-        oresp = requests.get(opt_url, timeout=8)
+        oresp = _YF_SESSION.get(opt_url, timeout=8)
         oresp.raise_for_status()
-        opayload = oresp.json() if oresp.content else {}
-        chain = ((opayload.get("optionChain") or {}).get("result") or [])
-        if not chain:
+        contracts = _yahoo_chain_contracts(oresp.content, side)
+        del oresp  # raw body no longer needed
+        if contracts is None:
             return JsonResponse({"error": "options unavailable"}, status=404)
-
-        chain0 = chain[0] or {}
-        expirations = chain0.get("expirationDates") or []
-        options = chain0.get("options") or []
-        if not expirations or not options:
-            return JsonResponse({"error": "options unavailable"}, status=404)
-
-        # Yahoo returns an options list matching a particular expiration (usually first in response).
-        opt0 = options[0] or {}
-        contracts = opt0.get("calls" if side == "call" else "puts") or []
         if not contracts:
             return JsonResponse({"error": "no contracts"}, status=404)
 
         # Pick strike closest to underlying price.
-        best = None
-        best_dist = None
-        for c in contracts:
-            strike = c.get("strike")
-            if strike is None:
-                continue
-            dist = abs(float(strike) - float(underlying_price))
-            if best is None or dist < best_dist:
-                best = c
-                best_dist = dist
+        best = _nearest_strike_contract(contracts, float(underlying_price))
 
         if not best:
             return JsonResponse({"error": "no contracts"}, status=404)
@@ -3713,11 +3953,11 @@ def option_suggest(request):
         exp_date = ""
         if exp_epoch:
             try:
-                exp_date = datetime.utcfromtimestamp(int(exp_epoch)).strftime("%Y-%m-%d")
+                exp_date = _epoch_to_ymd(int(exp_epoch))
             except Exception:
                 exp_date = ""
 
-        return JsonResponse(
+        return FastJsonResponse(
             {
                 "symbol": symbol,
                 "underlying_price": underlying_price,
@@ -3731,10 +3971,24 @@ def option_suggest(request):
                 "source": "yahoo",
             }
         )
-    except requests.RequestException:
+    except (requests.RequestException, ValueError):
         return JsonResponse({"error": "option fetch failed"}, status=502)
 
 
+@lru_cache(maxsize=4096)
+def _parse_exp_cached(expiration: str):
+    """Parse a YYYY-MM-DD expiration into (YYMMDD, date). Raises ValueError if malformed."""
+    dt = datetime.strptime(expiration, "%Y-%m-%d")
+    return dt.strftime("%y%m%d"), dt.date()
+
+
+@lru_cache(maxsize=8192)
+def _occ_contract(symbol: str, exp_yyMMdd: str, strike_millis: int, side: str) -> str:
+    """Polygon/OCC option ticker for an already-parsed expiration and strike (price * 1000)."""
+    cp = "C" if side == "call" else "P"
+    return f"O:{symbol}{exp_yyMMdd}{cp}{strike_millis:08d}"
+
+
 @login_required
 @require_GET
 def option_quote(request):
@@ -3761,29 +4015,25 @@ def option_quote(request):
     if side not in ("call", "put"):
         return JsonResponse({"error": "side must be call or put"}, status=400)
 
-    try:
-        strike = float(strike_raw)
-    except ValueError:
+    strike = _to_float_or_none(strike_raw)
+    if strike is None:
         return JsonResponse({"error": "invalid strike"}, status=400)
     if strike <= 0 or strike > 999999.999:
         return JsonResponse({"error": "strike must be positive and under 1000000"}, status=400)
 
     # Parse YYYY-MM-DD -> YYMMDD (OCC format)
     try:
-        exp_dt = datetime.strptime(expiration, "%Y-%m-%d")
+        exp_yyMMdd, _ = _parse_exp_cached(expiration)
     except ValueError:
         return JsonResponse({"error": "expiration must be YYYY-MM-DD"}, status=400)
     # Polygon/OCC option ticker: O: + root + YYMMDD + C|P + strike(8 digits, strike*1000)
     # e.g. O:AAPL211119C00085000 = AAPL, 2021-11-19, Call, $85
-    exp_yyMMdd = exp_dt.strftime("%y%m%d")
     strike_int = int(round(strike * 1000))  # OCC: 8 digits = price * 1000
     if strike_int < 0 or strike_int > 99999999:
         return JsonResponse({"error": "strike out of range for option contract"}, status=400)
-    strike_formatted = f"{strike_int:08d}"
-    cp = "C" if side == "call" else "P"
-    contract = f"O:{symbol}{exp_yyMMdd}{cp}{strike_formatted}"
+    contract = _occ_contract(symbol, exp_yyMMdd, strike_int, side)
 
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     if not polygon_key:
         return JsonResponse({"error": "POLYGON_API_KEY is not set", "source": "polygon"}, status=502)
 
@@ -3796,7 +4046,7 @@ def option_quote(request):
             return None
 
     try:
-        client = PolygonClient(polygon_key)
+        client = _get_polygon_client(polygon_key)
         q = client.get_option_quote(contract)
     except Exception as e:
         logger.exception("option_quote: get_option_quote failed for %s", contract)
@@ -3806,7 +4056,7 @@ def option_quote(request):
         )
 
     if q and q.get("price") is not None:
-        return JsonResponse(
+        return FastJsonResponse(
             {
                 "symbol": symbol,
                 "expiration": expiration,
@@ -3840,7 +4090,60 @@ def option_quote(request):
         "source": "polygon",
         "polygon_error": polygon_err,
     }
-    return JsonResponse(payload)
+    return FastJsonResponse(payload)
+
+
+# Short-lived memo of best_option picks; concurrent identical requests wait on one fetch.
+_BEST_OPTION_TTL_SEC = 10
+_BEST_OPTION_CACHE_MAX = 1024
+_best_option_cache = {}
+_best_option_inflight = {}
+_best_option_lock = threading.Lock()
+
+
+def _best_option_cache_get(key):
+    entry = _best_option_cache.get(key)
+    if entry is not None and entry[0] > time.time():
+        return dict(entry[1])
+    return None
+
+
+def _cached_best_option(key, fetch):
+    """
+    Return fetch() -> (best, fetch_failed), memoized for _BEST_OPTION_TTL_SEC per key.
+    Only successful picks are cached; callers always get their own copy of the dict.
+    """
+    with _best_option_lock:
+        cached = _best_option_cache_get(key)
+        if cached is not None:
+            return cached, False
+        event = _best_option_inflight.get(key)
+        leader = event is None
+        if leader:
+            event = _best_option_inflight[key] = threading.Event()
+    if not leader:
+        event.wait(timeout=35)
+        with _best_option_lock:
+            cached = _best_option_cache_get(key)
+        if cached is not None:
+            return cached, False
+        return fetch()
+    try:
+        best, fetch_failed = fetch()
+        if best and not fetch_failed:
+            with _best_option_lock:
+                if len(_best_option_cache) >= _BEST_OPTION_CACHE_MAX:
+                    now = time.time()
+                    for k in [k for k, (exp, _) in _best_option_cache.items() if exp <= now]:
+                        del _best_option_cache[k]
+                    if len(_best_option_cache) >= _BEST_OPTION_CACHE_MAX:
+                        _best_option_cache.clear()
+                _best_option_cache[key] = (time.time() + _BEST_OPTION_TTL_SEC, dict(best))
+        return best, fetch_failed
+    finally:
+        with _best_option_lock:
+            _best_option_inflight.pop(key, None)
+        event.set()
 
 
 @login_required
@@ -3866,7 +4169,7 @@ def best_option(request):
     if not symbol:
         return JsonResponse({"error": "symbol is required"}, status=400)
 
-    polygon_key = getattr(settings, "POLYGON_API_KEY", "") or ""
+    polygon_key = _polygon_api_key()
     if not polygon_key:
         return JsonResponse({"error": "POLYGON_API_KEY is not set", "source": "polygon"}, status=502)
 
@@ -3874,20 +4177,17 @@ def best_option(request):
 
     # Use client-provided stock_price if valid; otherwise fetch from Polygon
     stock_price_param = request.GET.get("stock_price") or request.GET.get("underlying_price")
-    try:
-        underlying_price = float(stock_price_param) if stock_price_param else None
-    except (TypeError, ValueError):
-        underlying_price = None
+    underlying_price = _to_float_or_none(stock_price_param)
     if underlying_price is None or underlying_price <= 0:
-        client = PolygonClient(polygon_key)
+        client = _get_polygon_client(polygon_key)
         underlying_price = client.get_share_current_price(symbol)
         if underlying_price is None:
             payload = {"error": "underlying price unavailable", "source": "polygon"}
-            if getattr(settings, "DEBUG", False):
+            if _debug_enabled():
                 payload["polygon_error"] = getattr(client, "last_error", None)
             return JsonResponse(payload, status=502)
     else:
-        client = PolygonClient(polygon_key)
+        client = _get_polygon_client(polygon_key)
 
     today = dt.date.today()
     # Fetch wider DTE ranges to cover all fallback levels
@@ -3903,16 +4203,8 @@ def best_option(request):
     exp_lte = (today + dt.timedelta(days=hi)).isoformat()
 
     # Strike filter: optional request params strike_gte / strike_lte; else default 0.5x–2x underlying price
-    strike_gte = request.GET.get("strike_gte")
-    strike_lte = request.GET.get("strike_lte")
-    try:
-        strike_gte = float(strike_gte) if strike_gte not in (None, "") else None
-    except (TypeError, ValueError):
-        strike_gte = None
-    try:
-        strike_lte = float(strike_lte) if strike_lte not in (None, "") else None
-    except (TypeError, ValueError):
-        strike_lte = None
+    strike_gte = _to_float_or_none(request.GET.get("strike_gte"))
+    strike_lte = _to_float_or_none(request.GET.get("strike_lte"))
     if strike_gte is None or strike_lte is None:
         try:
             price_float = float(underlying_price)
@@ -3923,21 +4215,26 @@ def best_option(request):
         except (TypeError, ValueError):
             pass
 
-    # Fetch option chain (with pagination + filter) and pick best contract in one call
-    best, fetch_failed = client.get_best_option(
-        underlying=symbol,
-        side=side,
-        expiration_gte=exp_gte,
-        expiration_lte=exp_lte,
-        strike_gte=strike_gte,
-        strike_lte=strike_lte,
-        underlying_price=float(underlying_price),
-        trade_type=trade_type,
-        timeout=30,
+    # Fetch option chain (with pagination + filter) and pick best contract in one call.
+    # Identical requests within a few seconds share one upstream fetch. The pick depends on the
+    # underlying price, so it is part of the key.
+    best, fetch_failed = _cached_best_option(
+        (symbol, side, trade_type, exp_gte, strike_gte, strike_lte, round(float(underlying_price), 2)),
+        lambda: client.get_best_option(
+            underlying=symbol,
+            side=side,
+            expiration_gte=exp_gte,
+            expiration_lte=exp_lte,
+            strike_gte=strike_gte,
+            strike_lte=strike_lte,
+            underlying_price=float(underlying_price),
+            trade_type=trade_type,
+            timeout=30,
+        ),
     )
     if fetch_failed:
         payload = {"error": "options unavailable", "source": "polygon"}
-        if getattr(settings, "DEBUG", False):
+        if _debug_enabled():
             payload["polygon_error"] = getattr(client, "last_error", None)
             payload["query"] = {"expiration_gte": exp_gte, "expiration_lte": exp_lte, "side": side, "trade_type": trade_type}
         return JsonResponse(payload, status=502)
@@ -3969,26 +4266,65 @@ def best_option(request):
             except Exception:
                 pass
     best["source"] = "polygon_snapshot"
-    return JsonResponse(best)
+    return FastJsonResponse(best)
 
 def is_superuser(user):
     """Check if user is superuser"""
     return user.is_superuser
 
+
+_USER_COUNT_GEN_KEY = "user_mgmt_cnt_gen"
+_USER_COUNT_TTL_SEC = 30
+
+
+def _invalidate_user_counts():
+    """Bump the generation so cached user_management counts are recomputed."""
+    try:
+        cache.incr(_USER_COUNT_GEN_KEY)
+    except ValueError:
+        cache.set(_USER_COUNT_GEN_KEY, 1, None)
+
+
+class _CachedCountPaginator(Paginator):
+    """
+    Paginator whose total count is cached briefly per filter combination.
+    The user list count is a COUNT(DISTINCT ...) over a join when searching; page changes reuse it.
+    """
+
+    def __init__(self, object_list, per_page, *, count_key, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count_key = count_key
+
+    @cached_property
+    def count(self):
+        gen = cache.get_or_set(_USER_COUNT_GEN_KEY, 0, None)
+        key = f"user_mgmt_cnt:{gen}:{self._count_key}"
+        return cache.get_or_set(key, lambda: Paginator.count.func(self), _USER_COUNT_TTL_SEC)
+
 @login_required
 @user_passes_test(is_superuser)
+@require_GET
 def user_management(request):
     """List all users"""
-    users = User.objects.all().prefetch_related('discord_channels').order_by('-date_joined')
+    # Only the columns the user table renders, for both users and their channels.
+    users = User.objects.only(
+        'id', 'username', 'email', 'date_joined', 'is_staff', 'is_superuser', 'is_active',
+    ).prefetch_related(
+        Prefetch(
+            'discord_channels',
+            queryset=DiscordChannel.objects.only('id', 'user', 'channel_name', 'is_default', 'is_active'),
+        )
+    ).order_by('-date_joined')
     
     # Handle search
     search_query = request.GET.get('search', '').strip()
     if search_query:
+        # Channel matches via EXISTS rather than a join, so no DISTINCT pass is needed.
         users = users.filter(
             Q(username__icontains=search_query) |
             Q(email__icontains=search_query) |
-            Q(discord_channels__channel_name__icontains=search_query)
-        ).distinct()
+            Exists(DiscordChannel.objects.filter(user_id=OuterRef('pk'), channel_name__icontains=search_query))
+        )
 
     # Role filter (for UI dropdown)
     role_filter = request.GET.get('role', 'all').strip().lower() or 'all'
@@ -4000,8 +4336,9 @@ def user_management(request):
     elif role_filter == 'user':
         users = users.filter(is_staff=False, is_superuser=False)
     
-    # Pagination
-    paginator = Paginator(users, 25)  # Show 25 users per page
+    # Pagination (count cached per search/role filter)
+    count_key = hashlib.md5(f"{role_filter}\0{search_query}".encode("utf-8")).hexdigest()
+    paginator = _CachedCountPaginator(users, 25, count_key=count_key)  # Show 25 users per page
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
     
@@ -4012,141 +4349,168 @@ def user_management(request):
         'role_filter': role_filter,
     })
 
+_CHANNEL_FIELD_RE = re.compile(r"^(?:channel_id|channel_name|webhook_url)_(\d+)$")
+
+
+def _collect_posted_channels(post, with_id=False):
+    """
+    Collect channel rows (channel_name_<i>, webhook_url_<i>, ...) from the user form POST.
+    Indices are discovered from the submitted keys in one scan, so only rows that were actually
+    posted are read and a blank or missing row no longer hides the ones after it.
+    """
+    indices = sorted({int(m.group(1)) for key in post if (m := _CHANNEL_FIELD_RE.match(key))})
+    channels = []
+    for index in indices:
+        channel_id = post.get(f'channel_id_{index}', '').strip() if with_id else ''
+        channel_name = post.get(f'channel_name_{index}', '').strip()
+        webhook_url = post.get(f'webhook_url_{index}', '').strip()
+        # If we have at least one field, consider it a channel attempt
+        if not (channel_id or channel_name or webhook_url):
+            continue
+        channel = {
+            'name': channel_name,
+            'url': webhook_url,
+            'is_default': post.get(f'is_default_{index}') == 'on',
+            'is_active': post.get(f'is_active_{index}', 'on') == 'on',
+            'index': index,
+        }
+        if with_id:
+            channel['id'] = channel_id or None
+        channels.append(channel)
+    return channels
+
+
+def _validate_user_post(post, is_edit=False):
+    """
+    Read and validate the user form POST shared by user_create and user_edit.
+    Returns (errors, ctx): ctx holds the cleaned fields plus 'channels' (the complete rows, with
+    exactly one default) and 'channels_data' for re-rendering the form. Nothing here touches the DB.
+    """
+    username = post.get('username', '').strip()
+    email = post.get('email', '').strip()
+    password = post.get('password', '').strip()
+    is_superuser_check = post.get('is_superuser') == 'on'
+    # Default to active if not specified (for create form)
+    is_active = post.get('is_active') == 'on' if is_edit else post.get('is_active', 'on') == 'on'
+
+    # Collect all Discord channels from POST data
+    channels = _collect_posted_channels(post, with_id=is_edit)
+
+    # Validate required fields
+    errors = []
+    if not username:
+        errors.append('Username is required.')
+    if not email:
+        errors.append('Email is required.')
+    if not password and not is_edit:
+        errors.append('Password is required.')
+
+    # Validate Discord channels - require at least one complete channel
+    valid_channels = []
+    channel_names = set()
+    for idx, channel in enumerate(channels):
+        if channel['name'] and channel['url']:
+            if channel['name'] in channel_names:
+                errors.append(f'Channel {idx + 1}: Channel name "{channel["name"]}" is used more than once.')
+                continue
+            channel_names.add(channel['name'])
+            valid_channels.append(channel)
+        elif channel['name'] or channel['url']:
+            errors.append(f'Channel {idx + 1}: Both channel name and webhook URL are required.')
+
+    if not valid_channels:
+        errors.append('At least one Discord channel with both channel name and webhook URL is required.')
+
+    # Ensure exactly one default channel when valid channels exist
+    if valid_channels:
+        if not any(c.get('is_default') for c in valid_channels):
+            valid_channels[0]['is_default'] = True
+        else:
+            seen_default = False
+            for c in valid_channels:
+                if c.get('is_default') and not seen_default:
+                    seen_default = True
+                elif c.get('is_default') and seen_default:
+                    c['is_default'] = False
+
+    ctx = {
+        'form_type': 'edit' if is_edit else 'create',
+        'username': username,
+        'email': email,
+        'password': password,
+        'is_superuser': is_superuser_check,
+        'is_active': is_active,
+        'channels': valid_channels,
+        'channels_data': valid_channels or channels,
+    }
+    return errors, ctx
+
+
+def _render_user_form(request, ctx, managed_user=None):
+    """Re-render user_form.html with the submitted values (the password is never echoed back)."""
+    context = {k: v for k, v in ctx.items() if k not in ('password', 'channels')}
+    if managed_user is not None:
+        context['managed_user'] = managed_user
+    return render(request, 'signals/user_form.html', context)
+
+
 @login_required
 @user_passes_test(is_superuser)
+@require_http_methods(["GET", "POST"])
 def user_create(request):
     """Create a new user"""
     if request.method == 'POST':
-        username = request.POST.get('username', '').strip()
-        email = request.POST.get('email', '').strip()
-        password = request.POST.get('password', '').strip()
-        is_superuser_check = request.POST.get('is_superuser') == 'on'
-        # Default to active if not specified (for create form)
-        is_active = request.POST.get('is_active', 'on') == 'on'
-        
-        # Collect all Discord channels from POST data
-        channels = []
-        index = 0
-        while True:
-            channel_name = request.POST.get(f'channel_name_{index}', '').strip()
-            webhook_url = request.POST.get(f'webhook_url_{index}', '').strip()
-            is_default = request.POST.get(f'is_default_{index}') == 'on'
-            channel_is_active = request.POST.get(f'is_active_{index}', 'on') == 'on'
-            
-            # If we have at least one field, consider it a channel attempt
-            if channel_name or webhook_url:
-                channels.append({
-                    'name': channel_name,
-                    'url': webhook_url,
-                    'is_default': is_default,
-                    'is_active': channel_is_active,
-                    'index': index
-                })
-                index += 1
-            else:
-                break
-        
-        # Validate required fields
-        errors = []
-        if not username:
-            errors.append('Username is required.')
-        if not email:
-            errors.append('Email is required.')
-        if not password:
-            errors.append('Password is required.')
-        
-        # Validate Discord channels - require at least one complete channel
-        valid_channels = []
-        for idx, channel in enumerate(channels):
-            if channel['name'] and channel['url']:
-                valid_channels.append(channel)
-            elif channel['name'] or channel['url']:
-                errors.append(f'Channel {idx + 1}: Both channel name and webhook URL are required.')
-        
-        if not valid_channels:
-            errors.append('At least one Discord channel with both channel name and webhook URL is required.')
-        
-        # Ensure exactly one default channel when valid channels exist
-        if valid_channels:
-            if not any(c.get('is_default') for c in valid_channels):
-                valid_channels[0]['is_default'] = True
-            else:
-                seen_default = False
-                for c in valid_channels:
-                    if c.get('is_default') and not seen_default:
-                        seen_default = True
-                    elif c.get('is_default') and seen_default:
-                        c['is_default'] = False
-
+        errors, ctx = _validate_user_post(request.POST)
         if errors:
             for error in errors:
                 messages.error(request, error)
-            return render(request, 'signals/user_form.html', {
-                'form_type': 'create',
-                'username': username,
-                'email': email,
-                'is_superuser': is_superuser_check,
-                'is_active': is_active,
-                'channels_data': valid_channels or channels,
-            })
+            return _render_user_form(request, ctx)
+        username = ctx['username']
+        valid_channels = ctx['channels']
         
-        # Check if username already exists
-        if User.objects.filter(username=username).exists():
-            messages.error(request, 'Username already exists.')
-            return render(request, 'signals/user_form.html', {
-                'form_type': 'create',
-                'username': username,
-                'email': email,
-                'is_superuser': is_superuser_check,
-                'is_active': is_active,
-                'channels_data': valid_channels or channels,
-            })
-        
-        # Create user
-        user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password,
-            is_superuser=is_superuser_check,
-            is_staff=is_superuser_check,
-            is_active=is_active
-        )
-        
-        # Create user profile (empty)
-        UserProfile.objects.create(
-            user=user,
-            discord_channel_name='',
-            discord_channel_webhook=''
-        )
-        
-        # Create Discord channels
-        channels_created = 0
-        channels_with_errors = []
-        
-        for channel in valid_channels:
-            try:
-                DiscordChannel.objects.create(
+        # Create user, profile and channels atomically. Username uniqueness is enforced by the
+        # database: a duplicate raises IntegrityError instead of costing an extra lookup query.
+        # Channel names were de-duplicated above, so the channel insert can't collide.
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=username,
+                    email=ctx['email'],
+                    password=ctx['password'],
+                    is_superuser=ctx['is_superuser'],
+                    is_staff=ctx['is_superuser'],
+                    is_active=ctx['is_active']
+                )
+
+                # Create user profile (empty)
+                UserProfile.objects.create(
                     user=user,
-                    channel_name=channel['name'],
-                    webhook_url=channel['url'],
-                    is_default=channel['is_default'],
-                    is_active=channel.get('is_active', True),
+                    discord_channel_name='',
+                    discord_channel_webhook=''
                 )
-                channels_created += 1
-            except Exception as e:
-                channels_with_errors.append(f"{channel['name']}: {str(e)}")
-        
-        # Show success/error messages
-        if channels_created > 0:
-            if channels_created == 1:
-                messages.success(request, f'User "{username}" and Discord channel created successfully!')
-            else:
-                messages.success(request, f'User "{username}" and {channels_created} Discord channels created successfully!')
-        
-        if channels_with_errors:
-            for error in channels_with_errors:
-                messages.warning(request, f'Error creating channel: {error}')
-        
+
+                # Create Discord channels (exactly one default was picked above)
+                DiscordChannel.objects.bulk_create([
+                    DiscordChannel(
+                        user=user,
+                        channel_name=channel['name'],
+                        webhook_url=channel['url'],
+                        is_default=channel['is_default'],
+                        is_active=channel.get('is_active', True),
+                    )
+                    for channel in valid_channels
+                ])
+        except IntegrityError:
+            messages.error(request, 'Username already exists.')
+            return _render_user_form(request, ctx)
+
+        _invalidate_user_counts()
+        channels_created = len(valid_channels)
+        if channels_created == 1:
+            messages.success(request, f'User "{username}" and Discord channel created successfully!')
+        else:
+            messages.success(request, f'User "{username}" and {channels_created} Discord channels created successfully!')
+
         return redirect('user_management')
     
     return render(request, 'signals/user_form.html', {
@@ -4155,6 +4519,7 @@ def user_create(request):
 
 @login_required
 @user_passes_test(is_superuser)
+@require_http_methods(["GET", "POST"])
 def user_edit(request, user_id):
     """Edit an existing user"""
     managed_user = get_object_or_404(User, id=user_id)
@@ -4164,6 +4529,10 @@ def user_edit(request, user_id):
         messages.error(request, 'You do not have permission to edit users.')
         return redirect('user_management')
     
+    if request.method == 'POST':
+        # Username, role and channel edits all change what the list filters match.
+        _invalidate_user_counts()
+
     # Handle legacy Discord channel management (older edit UI)
     if request.method == 'POST' and 'action' in request.POST:
         action = request.POST.get('action')
@@ -4222,133 +4591,87 @@ def user_edit(request, user_id):
     
     # Handle user update
     if request.method == 'POST':
-        username = request.POST.get('username', '').strip()
-        email = request.POST.get('email', '').strip()
-        is_superuser_check = request.POST.get('is_superuser') == 'on'
-        is_active = request.POST.get('is_active') == 'on'
-        new_password = request.POST.get('password', '').strip()
-
-        # Collect Discord channels from POST data (same format as create)
-        channels = []
-        index = 0
-        while True:
-            channel_id = request.POST.get(f'channel_id_{index}', '').strip()
-            channel_name = request.POST.get(f'channel_name_{index}', '').strip()
-            webhook_url = request.POST.get(f'webhook_url_{index}', '').strip()
-            is_default = request.POST.get(f'is_default_{index}') == 'on'
-            channel_is_active = request.POST.get(f'is_active_{index}', 'on') == 'on'
-
-            if channel_id or channel_name or webhook_url:
-                channels.append({
-                    'id': channel_id or None,
-                    'name': channel_name,
-                    'url': webhook_url,
-                    'is_default': is_default,
-                    'is_active': channel_is_active,
-                    'index': index
-                })
-                index += 1
-            else:
-                break
-        
-        # Validate required fields
-        errors = []
-        if not username:
-            errors.append('Username is required.')
-        if not email:
-            errors.append('Email is required.')
-
-        # Validate Discord channels - require at least one complete channel
-        valid_channels = []
-        for idx, channel in enumerate(channels):
-            if channel['name'] and channel['url']:
-                valid_channels.append(channel)
-            elif channel['name'] or channel['url']:
-                errors.append(f'Channel {idx + 1}: Both channel name and webhook URL are required.')
-
-        if not valid_channels:
-            errors.append('At least one Discord channel with both channel name and webhook URL is required.')
-
-        # Ensure exactly one default channel when valid channels exist
-        if valid_channels:
-            if not any(c.get('is_default') for c in valid_channels):
-                valid_channels[0]['is_default'] = True
-            else:
-                seen_default = False
-                for c in valid_channels:
-                    if c.get('is_default') and not seen_default:
-                        seen_default = True
-                    elif c.get('is_default') and seen_default:
-                        c['is_default'] = False
-        
+        errors, ctx = _validate_user_post(request.POST, is_edit=True)
         if errors:
             for error in errors:
                 messages.error(request, error)
-            return render(request, 'signals/user_form.html', {
-                'form_type': 'edit',
-                'managed_user': managed_user,
-                'username': username,
-                'email': email,
-                'is_superuser': is_superuser_check,
-                'is_active': is_active,
-                'channels_data': valid_channels or channels,
-            })
-        
-        # Check if username already exists (for other users)
-        if username != managed_user.username and User.objects.filter(username=username).exists():
-            messages.error(request, 'Username already exists.')
-            return render(request, 'signals/user_form.html', {
-                'form_type': 'edit',
-                'managed_user': managed_user,
-                'username': username,
-                'email': email,
-                'is_superuser': is_superuser_check,
-                'is_active': is_active,
-                'channels_data': valid_channels or channels,
-            })
+            return _render_user_form(request, ctx, managed_user)
+        username = ctx['username']
+        new_password = ctx['password']
+        valid_channels = ctx['channels']
         
         # Update user
         managed_user.username = username
-        managed_user.email = email
-        managed_user.is_superuser = is_superuser_check
-        managed_user.is_staff = is_superuser_check  # Staff status follows superuser status
-        managed_user.is_active = is_active
+        managed_user.email = ctx['email']
+        managed_user.is_superuser = ctx['is_superuser']
+        managed_user.is_staff = ctx['is_superuser']  # Staff status follows superuser status
+        managed_user.is_active = ctx['is_active']
         
         # Update password if provided
         if new_password:
             managed_user.set_password(new_password)
-        
-        managed_user.save()
-
-        # Sync Discord channels
-        existing = {str(c.id): c for c in DiscordChannel.objects.filter(user=managed_user)}
-        kept_ids = set()
-
-        for ch in valid_channels:
-            ch_id = (ch.get('id') or '').strip()
-            if ch_id and ch_id in existing:
-                obj = existing[ch_id]
-                obj.channel_name = ch['name']
-                obj.webhook_url = ch['url']
-                obj.is_default = bool(ch.get('is_default'))
-                obj.is_active = bool(ch.get('is_active', True))
-                obj.save()
-                kept_ids.add(ch_id)
+
+        # Username uniqueness is enforced by the database (IntegrityError on a clash) rather than
+        # a separate lookup. Channel names are unique per user too; the except branch works out
+        # which constraint was hit.
+        try:
+            with transaction.atomic():
+                managed_user.save()
+
+                # Sync Discord channels in bulk: one delete, one update, one insert.
+                # Bulk ops skip DiscordChannel.save(), which is fine here because valid_channels
+                # carries exactly one default and every other channel of the user is deleted.
+                existing = {str(c.id): c for c in DiscordChannel.objects.filter(user=managed_user)}
+                now = timezone.now()
+                updates = []
+                renamed = []
+                creates = []
+                for ch in valid_channels:
+                    ch_id = (ch.get('id') or '').strip()
+                    if ch_id and ch_id in existing:
+                        obj = existing.pop(ch_id)
+                        if obj.channel_name != ch['name']:
+                            renamed.append(obj)
+                        obj.channel_name = ch['name']
+                        obj.webhook_url = ch['url']
+                        obj.is_default = bool(ch.get('is_default'))
+                        obj.is_active = bool(ch.get('is_active', True))
+                        obj.updated_at = now
+                        updates.append(obj)
+                    else:
+                        creates.append(DiscordChannel(
+                            user=managed_user,
+                            channel_name=ch['name'],
+                            webhook_url=ch['url'],
+                            is_default=bool(ch.get('is_default')),
+                            is_active=bool(ch.get('is_active', True)),
+                        ))
+
+                # Delete removed channels first so their names are free for renames/new rows.
+                if existing:
+                    DiscordChannel.objects.filter(id__in=[obj.id for obj in existing.values()]).delete()
+                # Renames can swap names between existing channels (alpha <-> beta), which would
+                # break unique (user, channel_name) midway through one UPDATE. Park the renamed rows
+                # on per-id placeholder names first, then write the final names.
+                if renamed:
+                    DiscordChannel.objects.bulk_update(
+                        [DiscordChannel(id=obj.id, channel_name=f'__renaming__{obj.id}') for obj in renamed],
+                        fields=['channel_name'],
+                    )
+                if updates:
+                    DiscordChannel.objects.bulk_update(
+                        updates, fields=['channel_name', 'webhook_url', 'is_default', 'is_active', 'updated_at']
+                    )
+                if creates:
+                    DiscordChannel.objects.bulk_create(creates)
+        except IntegrityError:
+            managed_user.refresh_from_db()
+            if User.objects.filter(username=username).exclude(pk=managed_user.pk).exists():
+                messages.error(request, 'Username already exists.')
             else:
-                obj = DiscordChannel.objects.create(
-                    user=managed_user,
-                    channel_name=ch['name'],
-                    webhook_url=ch['url'],
-                    is_default=bool(ch.get('is_default')),
-                    is_active=bool(ch.get('is_active', True)),
-                )
-                kept_ids.add(str(obj.id))
+                messages.error(request, 'Discord channel names must be unique for this user.')
+            return _render_user_form(request, ctx, managed_user)
 
-        # Delete removed channels
-        for ch_id, obj in existing.items():
-            if ch_id not in kept_ids:
-                obj.delete()
-        
         messages.success(request, f'User "{username}" updated successfully!')
         return redirect('user_management')
     
@@ -4373,6 +4696,7 @@ def user_edit(request, user_id):
 
 @login_required
 @user_passes_test(is_superuser)
+@require_http_methods(["POST"])
 def user_delete(request, user_id):
     """Delete a user"""
     user = get_object_or_404(User, id=user_id)
@@ -4385,14 +4709,20 @@ def user_delete(request, user_id):
     # Delete user directly (JavaScript confirmation already handled in template)
     username = user.username
     user.delete()
+    _invalidate_user_counts()
     messages.success(request, f'User "{username}" deleted successfully!')
     return redirect('user_management')
 
 @login_required
+@require_GET
 def signal_types_list(request):
     """List all signal types for the current user (system defaults + user's custom types)"""
-    user_signal_types = SignalType.objects.filter(user=request.user).order_by('-created_at')
-    system_signal_types = SignalType.objects.filter(user__isnull=True).order_by('name')
+    # One query for both sections: the user's types newest first, system defaults by name.
+    user_signal_types = []
+    system_signal_types = []
+    for st in SignalType.objects.filter(Q(user=request.user) | Q(user__isnull=True)).order_by('-created_at'):
+        (system_signal_types if st.user_id is None else user_signal_types).append(st)
+    system_signal_types.sort(key=lambda st: st.name)
     
     return render(request, 'signals/signal_types_list.html', {
         'user_signal_types': user_signal_types,
@@ -4401,6 +4731,7 @@ def signal_types_list(request):
     })
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def signal_type_create(request):
     """Create a new signal type"""
     can_create_system = request.user.is_superuser
@@ -4427,9 +4758,10 @@ def signal_type_create(request):
     })
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def signal_type_edit(request, signal_type_id):
     """Edit an existing signal type"""
-    signal_type = get_object_or_404(SignalType, id=signal_type_id)
+    signal_type = get_object_or_404(SignalType.objects.select_related('user'), id=signal_type_id)
     
     # Check if this is a system default template (user is None)
     is_default = signal_type.user is None
@@ -4475,9 +4807,10 @@ def signal_type_edit(request, signal_type_id):
     })
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def signal_type_delete(request, signal_type_id):
     """Delete a signal type"""
-    signal_type = get_object_or_404(SignalType, id=signal_type_id)
+    signal_type = get_object_or_404(SignalType.objects.select_related('user'), id=signal_type_id)
     is_default = signal_type.user is None
     
     # Check if user has permission to delete this signal type